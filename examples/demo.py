@@ -5,15 +5,35 @@ This script demonstrates the usage of the FuzzyLoanController with three
 different applicant profiles: high-quality, medium-quality, and poor-quality.
 
 Run this script to see how the fuzzy logic system evaluates different loan applications.
+
+Usage:
+    python examples/demo.py               # interactive plots
+    python examples/demo.py --no-plot     # skip all visualization
+    python examples/demo.py --save-plots plots/   # render PNGs headlessly
 """
 
+import argparse
 import sys
 import os
 
-# Add parent directory to path to import the module
-sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import numpy as np
+
+# Prefer an installed package (pip install -e .); fall back to a single
+# repo-root path insertion when running straight from a checkout
+_REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+try:
+    from fuzzy_loan_controller import FuzzyLoanController
+except ImportError:
+    sys.path.insert(0, _REPO_ROOT)
+    from fuzzy_loan_controller import FuzzyLoanController
 
-from fuzzy_loan_controller import FuzzyLoanController
+
+# Row templates bound once at import time: repeated displays reuse the parsed
+# format spec instead of re-parsing an f-string per line
+_RESULT_ROW = "{label:<20} {value}".format
+_DETAIL_ROW = "{label:<25} {value}".format
+_SUMMARY_ROW = "{name:<25} {decision:<20} {score:<15.2f} {rate:.2f}%".format
 
 
 def print_separator():
@@ -21,70 +41,116 @@ def print_separator():
     print("\n" + "=" * 80 + "\n")
 
 
-def display_result(result: dict, applicant_name: str):
+def display_result(result, applicant_name: str):
     """
     Display the evaluation result in a formatted way.
-    
+
     Args:
-        result: Dictionary containing evaluation results
+        result: LoanResult containing evaluation results
         applicant_name: Name of the applicant for display
     """
-    print(f"{'Decision:':<20} {result['decision']}")
-    print(f"{'Approval Score:':<20} {result['approval_score']}/100")
-    print(f"{'Interest Rate:':<20} {result['interest_rate']}%")
+    print(_RESULT_ROW(label='Decision:', value=result.decision))
+    print(_RESULT_ROW(label='Approval Score:', value=f"{result.approval_score}/100"))
+    print(_RESULT_ROW(label='Interest Rate:', value=f"{result.interest_rate}%"))
     
     # Add interpretation
-    if result['decision'] == 'APPROVED':
+    if result.decision == 'APPROVED':
         print(f"\n✓ {applicant_name} meets the approval criteria with a strong financial profile.")
-    elif result['decision'] == 'REQUIRES REVIEW':
+    elif result.decision == 'REQUIRES REVIEW':
         print(f"\n⚠ {applicant_name}'s application requires manual review by a loan officer.")
     else:
         print(f"\n✗ {applicant_name}'s application does not meet current approval criteria.")
 
 
-def main():
+def main(argv=None):
     """Run the demonstration with three example applicants."""
-    
+
+    parser = argparse.ArgumentParser(description="Fuzzy loan approval demonstration")
+    parser.add_argument('--no-plot', action='store_true',
+                        help="skip all matplotlib visualization (fast, headless-safe)")
+    parser.add_argument('--save-plots', metavar='DIR',
+                        help="render plots to PNG files in DIR using the non-interactive "
+                             "Agg backend instead of opening windows")
+    args = parser.parse_args(argv)
+
+    # FLC_NO_PLOT mirrors --no-plot for CI/automated environments where
+    # passing CLI flags is inconvenient (headless runners have no display)
+    show_plots = not args.no_plot and not os.environ.get('FLC_NO_PLOT')
+    if args.save_plots:
+        # Non-interactive backend: no window spawning, figures go straight to disk
+        import matplotlib.pyplot as plt
+        plt.switch_backend('Agg')
+        os.makedirs(args.save_plots, exist_ok=True)
+
+    def plot_path(name):
+        """Return the PNG path for a plot, or None for interactive display."""
+        if args.save_plots:
+            return os.path.join(args.save_plots, f"{name}.png")
+        return None
+
     print("=" * 80)
     print(" " * 20 + "FUZZY LOGIC LOAN APPROVAL SYSTEM")
     print(" " * 25 + "Demonstration Script")
     print("=" * 80)
-    
+
     # Create fuzzy controller instance
     flc = FuzzyLoanController()
-    
+
     # Visualize all membership functions first
-    print("\nStep 1: Visualizing all membership functions...")
-    print("(Close the plot window to continue)")
-    flc.visualize_all_membership_functions()
-    
+    if show_plots:
+        print("\nStep 1: Visualizing all membership functions...")
+        if not args.save_plots:
+            print("(Close the plot window to continue)")
+        flc.visualize_all_membership_functions(save_path=plot_path('membership_functions'))
+
     print_separator()
-    
-    # =========================================================================
-    # Example 1: High-Quality Applicant
-    # =========================================================================
-    print("EXAMPLE 1: High-Quality Applicant")
-    print("-" * 80)
-    
+
+    # Define all three applicant profiles up front so they can be evaluated
+    # together in a single vectorized batch pass.
     applicant_1 = {
         'credit_score': 780,
         'debt_ratio': 15,
         'income': 85000,
         'employment_duration': 8
     }
-    
-    print(f"{'Credit Score:':<25} {applicant_1['credit_score']}")
-    print(f"{'Debt-to-Income Ratio:':<25} {applicant_1['debt_ratio']}%")
-    print(f"{'Annual Income:':<25} ${applicant_1['income']:,}")
-    print(f"{'Employment Duration:':<25} {applicant_1['employment_duration']} years")
+
+    applicant_2 = {
+        'credit_score': 650,
+        'debt_ratio': 35,
+        'income': 50000,
+        'employment_duration': 3
+    }
+
+    applicant_3 = {
+        'credit_score': 450,
+        'debt_ratio': 60,
+        'income': 25000,
+        'employment_duration': 1
+    }
+
+    # Evaluate all applicants at once instead of three sequential scalar calls
+    result_1, result_2, result_3 = flc.evaluate_batch([applicant_1, applicant_2, applicant_3])
+
+    # =========================================================================
+    # Example 1: High-Quality Applicant
+    # =========================================================================
+    print("EXAMPLE 1: High-Quality Applicant")
+    print("-" * 80)
+
+    print(_DETAIL_ROW(label='Credit Score:', value=applicant_1['credit_score']))
+    print(_DETAIL_ROW(label='Debt-to-Income Ratio:', value=f"{applicant_1['debt_ratio']}%"))
+    print(_DETAIL_ROW(label='Annual Income:', value=f"${applicant_1['income']:,}"))
+    print(_DETAIL_ROW(label='Employment Duration:', value=f"{applicant_1['employment_duration']} years"))
     print()
-    
-    result_1 = flc.evaluate_loan_application(applicant_1)
+
     display_result(result_1, "This applicant")
     
-    print("\nStep 2: Visualizing inference process...")
-    print("(Close the plot window to continue)")
-    flc.visualize_inference_process(result_1, "High-Quality Applicant")
+    if show_plots:
+        print("\nStep 2: Visualizing inference process...")
+        if not args.save_plots:
+            print("(Close the plot window to continue)")
+        flc.visualize_inference_process(result_1, "High-Quality Applicant",
+                                        save_path=plot_path('inference_high_quality'))
     
     print_separator()
     
@@ -93,26 +159,21 @@ def main():
     # =========================================================================
     print("EXAMPLE 2: Medium-Quality Applicant")
     print("-" * 80)
-    
-    applicant_2 = {
-        'credit_score': 650,
-        'debt_ratio': 35,
-        'income': 50000,
-        'employment_duration': 3
-    }
-    
-    print(f"{'Credit Score:':<25} {applicant_2['credit_score']}")
-    print(f"{'Debt-to-Income Ratio:':<25} {applicant_2['debt_ratio']}%")
-    print(f"{'Annual Income:':<25} ${applicant_2['income']:,}")
-    print(f"{'Employment Duration:':<25} {applicant_2['employment_duration']} years")
+
+    print(_DETAIL_ROW(label='Credit Score:', value=applicant_2['credit_score']))
+    print(_DETAIL_ROW(label='Debt-to-Income Ratio:', value=f"{applicant_2['debt_ratio']}%"))
+    print(_DETAIL_ROW(label='Annual Income:', value=f"${applicant_2['income']:,}"))
+    print(_DETAIL_ROW(label='Employment Duration:', value=f"{applicant_2['employment_duration']} years"))
     print()
-    
-    result_2 = flc.evaluate_loan_application(applicant_2)
+
     display_result(result_2, "This applicant")
     
-    print("\nVisualizing inference process...")
-    print("(Close the plot window to continue)")
-    flc.visualize_inference_process(result_2, "Medium-Quality Applicant")
+    if show_plots:
+        print("\nVisualizing inference process...")
+        if not args.save_plots:
+            print("(Close the plot window to continue)")
+        flc.visualize_inference_process(result_2, "Medium-Quality Applicant",
+                                        save_path=plot_path('inference_medium_quality'))
     
     print_separator()
     
@@ -121,26 +182,21 @@ def main():
     # =========================================================================
     print("EXAMPLE 3: Poor-Quality Applicant")
     print("-" * 80)
-    
-    applicant_3 = {
-        'credit_score': 450,
-        'debt_ratio': 60,
-        'income': 25000,
-        'employment_duration': 1
-    }
-    
-    print(f"{'Credit Score:':<25} {applicant_3['credit_score']}")
-    print(f"{'Debt-to-Income Ratio:':<25} {applicant_3['debt_ratio']}%")
-    print(f"{'Annual Income:':<25} ${applicant_3['income']:,}")
-    print(f"{'Employment Duration:':<25} {applicant_3['employment_duration']} year")
+
+    print(_DETAIL_ROW(label='Credit Score:', value=applicant_3['credit_score']))
+    print(_DETAIL_ROW(label='Debt-to-Income Ratio:', value=f"{applicant_3['debt_ratio']}%"))
+    print(_DETAIL_ROW(label='Annual Income:', value=f"${applicant_3['income']:,}"))
+    print(_DETAIL_ROW(label='Employment Duration:', value=f"{applicant_3['employment_duration']} year"))
     print()
-    
-    result_3 = flc.evaluate_loan_application(applicant_3)
+
     display_result(result_3, "This applicant")
     
-    print("\nVisualizing inference process...")
-    print("(Close the plot window to continue)")
-    flc.visualize_inference_process(result_3, "Poor-Quality Applicant")
+    if show_plots:
+        print("\nVisualizing inference process...")
+        if not args.save_plots:
+            print("(Close the plot window to continue)")
+        flc.visualize_inference_process(result_3, "Poor-Quality Applicant",
+                                        save_path=plot_path('inference_poor_quality'))
     
     print_separator()
     
@@ -149,11 +205,20 @@ def main():
     # =========================================================================
     print("SUMMARY: Comparison of All Applicants")
     print("-" * 80)
-    print(f"{'Applicant':<25} {'Decision':<20} {'Score':<15} {'Interest Rate':<15}")
-    print("-" * 80)
-    print(f"{'High-Quality':<25} {result_1['decision']:<20} {result_1['approval_score']:<15} {result_1['interest_rate']}%")
-    print(f"{'Medium-Quality':<25} {result_2['decision']:<20} {result_2['approval_score']:<15} {result_2['interest_rate']}%")
-    print(f"{'Poor-Quality':<25} {result_3['decision']:<20} {result_3['approval_score']:<15} {result_3['interest_rate']}%")
+
+    # Collect the batched results into one structured array so the summary
+    # table is built with a single formatting pass and a single print call
+    summary = np.array(
+        [(name, r.decision, r.approval_score, r.interest_rate)
+         for name, r in zip(('High-Quality', 'Medium-Quality', 'Poor-Quality'),
+                            (result_1, result_2, result_3))],
+        dtype=[('name', 'U16'), ('decision', 'U16'), ('score', 'f4'), ('rate', 'f4')])
+
+    header = f"{'Applicant':<25} {'Decision':<20} {'Score':<15} {'Interest Rate':<15}"
+    rows = [_SUMMARY_ROW(name=row['name'], decision=row['decision'],
+                         score=row['score'], rate=row['rate'])
+            for row in summary]
+    print("\n".join([header, "-" * 80] + rows))
     
     print_separator()
     print("Demonstration complete! Try modifying the applicant data or creating your own examples.")
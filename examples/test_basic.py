@@ -5,196 +5,135 @@ Run these basic tests to verify the system is working correctly.
 This is not a comprehensive test suite, but covers basic functionality.
 
 Usage:
-    python examples/test_basic.py
+    pytest examples/test_basic.py
+    python examples/test_basic.py   # delegates to pytest
 """
 
 import sys
 import os
 
-# Add parent directory to path
-sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import pytest
 
-from fuzzy_loan_controller import FuzzyLoanController
+# Tests never plot; set before importing the controller so anything reading
+# the flag at import time sees it
+os.environ['FLC_NO_PLOT'] = '1'
+
+# Prefer an installed package (pip install -e .); fall back to a single
+# repo-root path insertion when running straight from a checkout
+_REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+try:
+    from fuzzy_loan_controller import FuzzyLoanController
+except ImportError:
+    sys.path.insert(0, _REPO_ROOT)
+    from fuzzy_loan_controller import FuzzyLoanController
+
+
+@pytest.fixture(scope="module")
+def flc():
+    """One shared controller for the whole module: construction (and the JIT
+    kernel warmup it triggers) is paid once instead of per test."""
+    return FuzzyLoanController()
 
 
 def test_controller_initialization():
-    """Test that the controller initializes correctly."""
-    print("Test 1: Controller Initialization... ", end="")
-    try:
-        flc = FuzzyLoanController()
-        assert flc.credit_score_range == (300, 850)
-        assert flc.debt_ratio_range == (0, 100)
-        assert flc.income_range == (0, 200000)
-        assert flc.employment_duration_range == (0, 40)
-        print("✓ PASSED")
-        return True
-    except Exception as e:
-        print(f"✗ FAILED: {e}")
-        return False
-
-
-def test_membership_functions():
-    """Test membership function calculations."""
-    print("Test 2: Membership Functions... ", end="")
-    try:
-        flc = FuzzyLoanController()
-        
-        # Test triangular at peak
-        result = flc.triangular_membership(620, 500, 620, 720)
-        assert abs(result - 1.0) < 0.01, f"Expected 1.0, got {result}"
-        
-        # Test trapezoidal in flat region
-        result = flc.trapezoidal_membership(400, 300, 300, 500, 580)
-        assert abs(result - 1.0) < 0.01, f"Expected 1.0, got {result}"
-        
-        # Test membership outside range
-        result = flc.triangular_membership(100, 500, 620, 720)
-        assert abs(result - 0.0) < 0.01, f"Expected 0.0, got {result}"
-        
-        print("✓ PASSED")
-        return True
-    except Exception as e:
-        print(f"✗ FAILED: {e}")
-        return False
-
-
-def test_excellent_applicant():
-    """Test evaluation of an excellent applicant."""
-    print("Test 3: Excellent Applicant Evaluation... ", end="")
-    try:
-        flc = FuzzyLoanController()
-        result = flc.evaluate_loan_application({
-            'credit_score': 800,
-            'debt_ratio': 10,
-            'income': 100000,
-            'employment_duration': 10
-        })
-        
-        assert result['decision'] == 'APPROVED', f"Expected APPROVED, got {result['decision']}"
-        assert result['approval_score'] > 70, f"Expected score > 70, got {result['approval_score']}"
-        assert result['interest_rate'] < 10, f"Expected rate < 10%, got {result['interest_rate']}"
-        
-        print("✓ PASSED")
-        return True
-    except Exception as e:
-        print(f"✗ FAILED: {e}")
-        return False
-
-
-def test_poor_applicant():
-    """Test evaluation of a poor applicant."""
-    print("Test 4: Poor Applicant Evaluation... ", end="")
-    try:
-        flc = FuzzyLoanController()
-        result = flc.evaluate_loan_application({
-            'credit_score': 400,
-            'debt_ratio': 70,
-            'income': 20000,
-            'employment_duration': 0.5
-        })
-        
-        assert result['decision'] == 'REJECTED', f"Expected REJECTED, got {result['decision']}"
-        assert result['approval_score'] < 40, f"Expected score < 40, got {result['approval_score']}"
-        assert result['interest_rate'] > 15, f"Expected rate > 15%, got {result['interest_rate']}"
-        
-        print("✓ PASSED")
-        return True
-    except Exception as e:
-        print(f"✗ FAILED: {e}")
-        return False
-
-
-def test_borderline_applicant():
-    """Test evaluation of a borderline applicant."""
-    print("Test 5: Borderline Applicant Evaluation... ", end="")
-    try:
-        flc = FuzzyLoanController()
-        result = flc.evaluate_loan_application({
-            'credit_score': 650,
-            'debt_ratio': 35,
-            'income': 50000,
-            'employment_duration': 3
-        })
-        
-        # Borderline cases should require review
-        assert result['decision'] in ['REQUIRES REVIEW', 'APPROVED'], \
-            f"Expected REQUIRES REVIEW or APPROVED, got {result['decision']}"
-        assert 30 < result['approval_score'] < 80, \
-            f"Expected score between 30-80, got {result['approval_score']}"
-        
-        print("✓ PASSED")
-        return True
-    except Exception as e:
-        print(f"✗ FAILED: {e}")
-        return False
-
-
-def test_output_format():
+    """Test that the controller initializes correctly (direct construction)."""
+    controller = FuzzyLoanController()
+    assert controller.credit_score_range == (300, 850)
+    assert controller.debt_ratio_range == (0, 100)
+    assert controller.income_range == (0, 200000)
+    assert controller.employment_duration_range == (0, 40)
+
+
+@pytest.mark.parametrize("x, params, expected", [
+    (620, (500, 620, 720), 1.0),    # triangular at peak
+    (100, (500, 620, 720), 0.0),    # triangular outside range
+])
+def test_triangular_membership(flc, x, params, expected):
+    """Test triangular membership function calculations."""
+    assert abs(flc.triangular_membership(x, *params) - expected) < 0.01
+
+
+def test_trapezoidal_membership(flc):
+    """Test trapezoidal membership in the flat-top region."""
+    assert abs(flc.trapezoidal_membership(400, 300, 300, 500, 580) - 1.0) < 0.01
+
+
+@pytest.mark.parametrize("x, params", [
+    (0, (0, 0, 20, 35)),          # debt ratio 0 is fully "low"
+    (100, (45, 60, 100, 100)),    # debt ratio 100 is fully "high"
+    (300, (300, 300, 500, 580)),  # credit score 300 is fully "poor"
+    (850, (720, 800, 850, 850)),  # credit score 850 is fully "excellent"
+])
+def test_trapezoidal_membership_closed_shoulders(flc, x, params):
+    """Shoulder sets are closed at the range boundaries: the extreme input
+    values carry full membership, not zero (an early implementation returned
+    0.0 exactly at these points, mis-scoring range-edge applicants)."""
+    assert flc.trapezoidal_membership(x, *params) == 1.0
+
+
+@pytest.mark.parametrize("applicant, decision", [
+    ({'credit_score': 800, 'debt_ratio': 0,
+      'income': 100000, 'employment_duration': 10}, 'APPROVED'),
+    ({'credit_score': 450, 'debt_ratio': 100,
+      'income': 25000, 'employment_duration': 1}, 'REJECTED'),
+])
+def test_range_boundary_decisions(flc, applicant, decision):
+    """Range-edge inputs fuzzify with full shoulder membership, so decisions
+    at the extremes line up with the neighbouring in-range behavior."""
+    assert flc.evaluate_loan_application(applicant)['decision'] == decision
+
+
+@pytest.mark.parametrize("profile, applicant", [
+    ('excellent', {'credit_score': 800, 'debt_ratio': 10,
+                   'income': 100000, 'employment_duration': 10}),
+    ('poor', {'credit_score': 400, 'debt_ratio': 70,
+              'income': 20000, 'employment_duration': 0.5}),
+    ('borderline', {'credit_score': 650, 'debt_ratio': 35,
+                    'income': 50000, 'employment_duration': 3}),
+])
+def test_applicant_evaluation(flc, profile, applicant):
+    """Test evaluation of representative applicant profiles."""
+    result = flc.evaluate_loan_application(applicant)
+
+    if profile == 'excellent':
+        assert result['decision'] == 'APPROVED'
+        assert result['approval_score'] > 70
+        assert result['interest_rate'] < 10
+    elif profile == 'poor':
+        assert result['decision'] == 'REJECTED'
+        assert result['approval_score'] < 40
+        assert result['interest_rate'] > 15
+    else:  # borderline cases should at most require review
+        assert result['decision'] in ['REQUIRES REVIEW', 'APPROVED']
+        assert 30 < result['approval_score'] < 80
+
+
+def test_output_format(flc):
     """Test that output has correct format."""
-    print("Test 6: Output Format Validation... ", end="")
-    try:
-        flc = FuzzyLoanController()
-        result = flc.evaluate_loan_application({
-            'credit_score': 700,
-            'debt_ratio': 30,
-            'income': 60000,
-            'employment_duration': 4
-        })
-        
-        # Check all required keys exist
-        required_keys = ['approval_score', 'interest_rate', 'decision', 'rule_activations', 'inputs']
-        for key in required_keys:
-            assert key in result, f"Missing key: {key}"
-        
-        # Check data types
-        assert isinstance(result['approval_score'], (int, float))
-        assert isinstance(result['interest_rate'], (int, float))
-        assert isinstance(result['decision'], str)
-        assert isinstance(result['rule_activations'], dict)
-        
-        # Check value ranges
-        assert 0 <= result['approval_score'] <= 100
-        assert 3 <= result['interest_rate'] <= 25
-        assert result['decision'] in ['APPROVED', 'REQUIRES REVIEW', 'REJECTED']
-        
-        print("✓ PASSED")
-        return True
-    except Exception as e:
-        print(f"✗ FAILED: {e}")
-        return False
-
-
-def run_all_tests():
-    """Run all tests and report results."""
-    print("=" * 70)
-    print(" " * 15 + "FUZZY LOAN APPROVAL SYSTEM - BASIC TESTS")
-    print("=" * 70)
-    print()
-    
-    tests = [
-        test_controller_initialization,
-        test_membership_functions,
-        test_excellent_applicant,
-        test_poor_applicant,
-        test_borderline_applicant,
-        test_output_format
-    ]
-    
-    results = [test() for test in tests]
-    
-    print()
-    print("=" * 70)
-    print(f"RESULTS: {sum(results)}/{len(results)} tests passed")
-    print("=" * 70)
-    
-    if all(results):
-        print("\n✓ All tests passed! The system is working correctly.")
-        return 0
-    else:
-        print("\n✗ Some tests failed. Please check the implementation.")
-        return 1
+    result = flc.evaluate_loan_application({
+        'credit_score': 700,
+        'debt_ratio': 30,
+        'income': 60000,
+        'employment_duration': 4
+    })
+
+    # Check all required keys exist
+    required_keys = ['approval_score', 'interest_rate', 'decision', 'rule_activations', 'inputs']
+    for key in required_keys:
+        assert key in result, f"Missing key: {key}"
+
+    # Check data types
+    assert isinstance(result['approval_score'], (int, float))
+    assert isinstance(result['interest_rate'], (int, float))
+    assert isinstance(result['decision'], str)
+    assert isinstance(result['rule_activations'], dict)
+
+    # Check value ranges
+    assert 0 <= result['approval_score'] <= 100
+    assert 3 <= result['interest_rate'] <= 25
+    assert result['decision'] in ['APPROVED', 'REQUIRES REVIEW', 'REJECTED']
 
 
 if __name__ == "__main__":
-    exit_code = run_all_tests()
-    sys.exit(exit_code)
+    sys.exit(pytest.main([__file__, "-v"]))
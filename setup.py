@@ -22,6 +22,7 @@ setup(
     long_description_content_type="text/markdown",
     url="https://github.com/yourusername/fuzzy-loan-approval",
     packages=find_packages(),
+    py_modules=["fuzzy_loan_controller"],
     classifiers=[
         "Development Status :: 4 - Beta",
         "Intended Audience :: Education",